@@ -3,7 +3,11 @@
 This module keeps outbound HTTP details in one place so we can
 reuse across onboarding (enrollment) and attendance (identification).
 """
+import io
+import json
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterable, Optional
 
 import requests
@@ -11,55 +15,137 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from django.conf import settings
 
+try:
+    # Optional: streams multipart bodies straight from the file objects so
+    # large enrollment photos are never buffered whole in memory.
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # pragma: no cover - optional dependency
+    MultipartEncoder = None
+
+try:
+    # Optional: C-implemented JSON parsing for large identify() payloads.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = getattr(settings, "FACE_API_BASE_URL", "http://13.50.238.213:8000").rstrip("/")
 CONNECT_TIMEOUT = float(getattr(settings, "FACE_API_CONNECT_TIMEOUT", 5))
 READ_TIMEOUT = float(getattr(settings, "FACE_API_READ_TIMEOUT", 60))
 ENABLED = bool(getattr(settings, "FACE_API_ENABLED", True))
+# Connection pool size; should roughly match expected worker concurrency so
+# bursts of identify() calls don't tear down and re-open sockets.
+POOL_SIZE = int(getattr(settings, "FACE_API_POOL_SIZE", 32))
 
 
 class FaceAPIError(Exception):
     """Raised when the face API returns an error or cannot be reached."""
 
+    def __init__(self, message, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
-def _session() -> requests.Session:
-    s = requests.Session()
-    retry = Retry(
-        total=2,
-        connect=2,
-        read=2,
-        backoff_factor=0.5,
-        status_forcelist=(502, 503, 504),
-        allowed_methods=frozenset(["POST"]),
-        raise_on_status=False,
-    )
-    s.mount("http://", HTTPAdapter(max_retries=retry))
-    s.mount("https://", HTTPAdapter(max_retries=retry))
-    return s
 
+# Shared session so keep-alive connections are reused across calls instead of
+# paying a fresh TCP/TLS handshake per request.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
 
-def _post(path: str, *, data=None, files=None) -> dict:
-    url = f"{BASE_URL}{path}"
+# Retry policy is immutable, so build (and validate) it once at import time
+_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=2,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False,
+)
+
+
+def _get_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_SIZE,
+                    pool_maxsize=POOL_SIZE,
+                    pool_block=False,
+                    max_retries=_RETRY,
+                )
+                s.mount("http://", adapter)
+                s.mount("https://", adapter)
+                if MultipartEncoder is not None:
+                    # Streamed enrollment bodies are one-shot: a retried POST
+                    # would re-send the already-exhausted encoder and hang
+                    # until timeout, so that endpoint skips the retry policy.
+                    s.mount(
+                        f"{BASE_URL}/add_person",
+                        HTTPAdapter(
+                            pool_connections=POOL_SIZE,
+                            pool_maxsize=POOL_SIZE,
+                            pool_block=False,
+                        ),
+                    )
+                s.headers.update({"Connection": "keep-alive", "User-Agent": "employee-user/1.0"})
+                _SESSION = s
+    return _SESSION
+
+
+def close_session() -> None:
+    """Close the shared session (tests / shutdown hooks)."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+def _parse_body(content: bytes) -> Optional[dict]:
+    """Decode a JSON body, preferring orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+def _post(path: str, *, data=None, files=None, headers=None) -> dict:
+    # Bail out before touching the URL or session when disabled (test/dev)
     if not ENABLED:
         raise FaceAPIError("Face API is disabled by settings")
+    url = f"{BASE_URL}{path}"
     try:
-        response = _session().post(url, data=data, files=files, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        response = _get_session().post(
+            url, data=data, files=files, headers=headers, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+        )
     except requests.RequestException as exc:  # pragma: no cover - network
         logger.exception("Face API request failed: %s", exc)
         raise FaceAPIError(f"Could not reach face API: {exc}") from exc
 
+    # Read the body exactly once; the raw fallback decodes the same bytes
+    # instead of going back through response.text's encoding sniffing.
+    content = response.content
     if response.status_code >= 400:
-        try:
-            detail = response.json()
-        except ValueError:
-            detail = response.text
-        raise FaceAPIError(f"{path} returned {response.status_code}: {detail}")
+        detail = _parse_body(content)
+        if detail is None:
+            detail = content.decode(response.encoding or "utf-8", errors="replace")
+        raise FaceAPIError(
+            f"{path} returned {response.status_code}: {detail}",
+            status_code=response.status_code,
+        )
 
-    try:
-        return response.json()
-    except ValueError:
-        return {"raw": response.text}
+    parsed = _parse_body(content)
+    if parsed is not None:
+        return parsed
+    return {"raw": content.decode(response.encoding or "utf-8", errors="replace")}
 
 
 def add_person(person_name: str, images: Iterable) -> dict:
@@ -81,6 +167,16 @@ def add_person(person_name: str, images: Iterable) -> dict:
     if not files_payload:
         raise FaceAPIError("No face images provided for enrollment")
 
+    if MultipartEncoder is not None:
+        encoder = MultipartEncoder(
+            fields=[("person_name", person_name)] + files_payload
+        )
+        return _post(
+            "/add_person",
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+        )
+
     return _post("/add_person", data={"person_name": person_name}, files=files_payload)
 
 
@@ -92,30 +188,111 @@ def migrate() -> dict:
     return _post("/migrate")
 
 
+# Background execution: lets request handlers hand slow enrollment/index
+# work to a small worker pool instead of blocking the Django worker.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="face-api")
+
+
+def _log_async_failure(future: Future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Background face API call failed: %s", exc)
+
+
+def _submit(fn, *args, **kwargs) -> Future:
+    future = _EXECUTOR.submit(fn, *args, **kwargs)
+    future.add_done_callback(_log_async_failure)
+    return future
+
+
+def add_person_async(person_name: str, images: Iterable) -> Future:
+    """Enroll a person in the background; returns a Future.
+
+    Image contents are copied into memory up front because the request's
+    uploaded files are closed once the response goes out.
+    """
+    files_payload = []
+    for image in images:
+        if hasattr(image, "seek"):
+            image.seek(0)
+        files_payload.append(
+            (
+                "files",
+                (
+                    getattr(image, "name", "face.jpg"),
+                    io.BytesIO(image.read()),
+                    getattr(image, "content_type", "image/jpeg"),
+                ),
+            )
+        )
+
+    if not files_payload:
+        raise FaceAPIError("No face images provided for enrollment")
+
+    return _submit(_post, "/add_person", data={"person_name": person_name}, files=files_payload)
+
+
+def rebuild_db_async() -> Future:
+    return _submit(rebuild_db)
+
+
+def migrate_async() -> Future:
+    return _submit(migrate)
+
+
 def identify(image_bytes: bytes) -> dict:
     file_tuple = ("capture.jpg", image_bytes, "image/jpeg")
     return _post("/identify", files={"file": file_tuple})
 
 
+def identify_batch(images: Iterable[bytes]) -> list:
+    """Identify several captured frames in one round-trip.
+
+    Falls back to one ``identify`` call per frame when the backend does
+    not expose ``/identify_batch``.
+    """
+    images = list(images)
+    if not images:
+        return []
+
+    files_payload = [
+        ("files", (f"capture_{i}.jpg", image_bytes, "image/jpeg"))
+        for i, image_bytes in enumerate(images)
+    ]
+    try:
+        result = _post("/identify_batch", files=files_payload)
+    except FaceAPIError as exc:
+        if exc.status_code != 404:
+            raise
+        return [identify(image_bytes) for image_bytes in images]
+
+    if isinstance(result, list):
+        return result
+    return result.get("results") or [result]
+
+
+# Keys checked for the matched person name, hoisted so the identify hot path
+# does not rebuild the tuple on every response.
+_NAME_KEYS = ("person_name", "person", "name", "label")
+
+
 def extract_match_name(payload: dict) -> Optional[str]:
     """Return the best guess of the matched person name from API payload."""
     if not isinstance(payload, dict):
         return None
 
-    for key in ("person_name", "person", "name", "label"):
-        value = payload.get(key)
-        if value:
-            return str(value)
+    value = next((payload[key] for key in _NAME_KEYS if payload.get(key)), None)
+    if value:
+        return str(value)
 
     # Some APIs return a list under "matches" or similar
-    matches = payload.get("matches") or payload.get("results")
-    if isinstance(matches, list) and matches:
+    matches = payload.get("matches") or payload.get("results") or ()
+    if isinstance(matches, (list, tuple)) and matches:
         first = matches[0]
         if isinstance(first, dict):
-            for key in ("person_name", "person", "name", "label"):
-                value = first.get(key)
-                if value:
-                    return str(value)
+            value = next((first[key] for key in _NAME_KEYS if first.get(key)), None)
+            if value:
+                return str(value)
         elif isinstance(first, str):
             return first
 
@@ -0,0 +1,16 @@
+from datetime import date
+
+
+class RequestTodayMiddleware:
+    """Attach today's date to the request once.
+
+    Views that compare against the current month all read the same value,
+    so a request that straddles midnight can't see two different days.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.today = date.today()
+        return self.get_response(request)
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-31 02:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_leave_request'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employeedocument',
+            index=models.Index(fields=['employee', '-uploaded_at'], name='core_employ_employe_a00391_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobhistory',
+            index=models.Index(fields=['employee', '-effective_date'], name='core_jobhis_employe_348d10_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payroll',
+            index=models.Index(fields=['employee', '-payment_date'], name='core_payrol_employe_c75c8c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='salarycomponent',
+            index=models.Index(fields=['employee', 'component_type'], name='core_salary_employe_d838b3_idx'),
+        ),
+    ]
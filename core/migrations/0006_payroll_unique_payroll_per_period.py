@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-31 02:37
+
+from django.db import migrations, models
+
+
+def remove_duplicate_payrolls(apps, schema_editor):
+    """Keep the oldest payroll per (employee, period_start) so the unique
+    constraint below can be applied to existing data."""
+    Payroll = apps.get_model('core', 'Payroll')
+    seen = set()
+    for payroll in Payroll.objects.order_by('employee_id', 'period_start', 'id'):
+        key = (payroll.employee_id, payroll.period_start)
+        if key in seen:
+            payroll.delete()
+        else:
+            seen.add(key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_employeedocument_core_employ_employe_a00391_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_payrolls, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='payroll',
+            constraint=models.UniqueConstraint(fields=('employee', 'period_start'), name='unique_payroll_per_period'),
+        ),
+    ]
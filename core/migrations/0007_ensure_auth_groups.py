@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def ensure_groups(apps, schema_editor):
+    """Create the HR and Employee groups the views rely on.
+
+    The views treat these as singletons, so guaranteeing them here lets
+    the write paths use a plain (cacheable) get instead of get_or_create.
+    """
+    Group = apps.get_model("auth", "Group")
+    for name in ("HR", "Employee"):
+        Group.objects.get_or_create(name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_payroll_unique_payroll_per_period"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(ensure_groups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 02:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_ensure_auth_groups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workschedule',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_workschedule_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employmentcontract',
+            index=models.Index(fields=['employee', '-start_date'], name='core_employ_employe_6a97a9_idx'),
+        ),
+    ]
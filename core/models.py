@@ -1,11 +1,23 @@
+from django.core.cache import cache
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 # Create your models here.
 
+
+@receiver(m2m_changed, sender=User.groups.through)
+def _invalidate_is_hr_cache(sender, instance, pk_set, reverse, **kwargs):
+    """Drop the cached HR-membership flag when a user's groups change."""
+    if reverse:
+        # instance is a Group; pk_set holds the affected user pks
+        for pk in pk_set or ():
+            cache.delete(f"user:{pk}:is_hr")
+    else:
+        cache.delete(f"user:{instance.pk}:is_hr")
+
 class EmployeeProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
 
@@ -121,6 +133,9 @@ class JobHistory(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["employee", "-effective_date"])]
+
 class EmploymentContract(models.Model):
     employee = models.ForeignKey(EmployeeProfile, on_delete=models.CASCADE)
 
@@ -133,11 +148,16 @@ class EmploymentContract(models.Model):
 
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["employee", "-start_date"])]
+
 class WorkSchedule(models.Model):
     employee = models.OneToOneField(EmployeeProfile, on_delete=models.CASCADE)
 
     working_hours = models.CharField(max_length=50)   # "9:00am – 5:00pm"
     working_days = models.CharField(max_length=100)   # "Mon – Fri"
+    # Feeds cache keys so edits invalidate cached schedule fragments
+    updated_at = models.DateTimeField(auto_now=True)
 
 class SalaryComponent(models.Model):
     COMPONENT_TYPE = [
@@ -150,6 +170,9 @@ class SalaryComponent(models.Model):
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     component_type = models.CharField(max_length=10, choices=COMPONENT_TYPE)
 
+    class Meta:
+        indexes = [models.Index(fields=["employee", "component_type"])]
+
 class Payroll(models.Model):
     employee = models.ForeignKey(EmployeeProfile, on_delete=models.CASCADE)
 
@@ -165,6 +188,17 @@ class Payroll(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["employee", "-payment_date"])]
+        constraints = [
+            # One payroll per employee per period; lets the monthly
+            # ensure-payroll path lean on get_or_create without racing
+            models.UniqueConstraint(
+                fields=["employee", "period_start"],
+                name="unique_payroll_per_period",
+            ),
+        ]
+
 class BankDetail(models.Model):
     employee = models.OneToOneField(EmployeeProfile, on_delete=models.CASCADE)
 
@@ -196,6 +230,9 @@ class EmployeeDocument(models.Model):
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["employee", "-uploaded_at"])]
+
 class RequiredDocument(models.Model):
     employee = models.ForeignKey(EmployeeProfile, on_delete=models.CASCADE)
 
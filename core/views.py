@@ -2,13 +2,22 @@ from django.contrib.auth.models import User, Group
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import IntegerField, Max, Q, Sum
+from django.db.models.functions import Cast, Substr
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+import re
 import secrets
 import base64
 from collections import defaultdict
+from calendar import monthrange
+from datetime import date, datetime, timedelta, time as dt_time
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
 from .forms import BankDetailForm, EmployeeDocumentForm
 from .models import (
@@ -29,30 +38,100 @@ from .models import (
 from . import face_api
 
 
+# Strips thousands separators and spaces from salary amounts in one pass
+_SALARY_TRANS = str.maketrans("", "", ", ")
+
+# Largest base64 webcam capture accepted by attendance (~2MB decoded)
+_MAX_CAPTURE_B64_LEN = 2_800_000
+
+# Inserts the missing space in times like "10:00AM"; compiled once
+_AMPM_RE = re.compile(r'(\d)(AM|PM)')
+
+# Onboarding form text -> model choice keys
+_EMPLOYMENT_TYPE_MAP = {
+    "full time": "FULL_TIME",
+    "part time": "PART_TIME",
+    "contract": "CONTRACT",
+}
+_STATUS_MAP = {
+    "active": "ACTIVE",
+    "inactive": "INACTIVE",
+}
+
+
+# Editable columns per admin tab; POST handlers assign these table-driven
+# and reuse the changed subset as update_fields
+_PERSONAL_FIELDS = (
+    "full_name",
+    "gender",
+    "date_of_birth",
+    "email",
+    "phone_number",
+    "marital_status",
+    "personal_id",
+    "emergency_contact",
+)
+_JOB_FIELDS = ("job_title", "department", "office", "employment_type", "status")
+_SCHEDULE_FIELDS = ("working_hours", "working_days")
+_BANK_FIELDS = ("bank_name", "account_title", "account_number", "iban", "payment_frequency")
+
+
+def _assign_posted(obj, fields: tuple, post) -> list:
+    """Copy the posted subset of ``fields`` onto ``obj``.
+
+    Returns the assigned names, ready to pass as update_fields.
+    """
+    changed = [f for f in fields if f in post]
+    for f in changed:
+        setattr(obj, f, post[f])
+    return changed
+
+
+
 # ================= PERMISSION HELPERS =================
 
+def _user_is_hr(user) -> bool:
+    """HR group membership, cached briefly so decorators plus view bodies
+    cost at most one membership query per minute per user."""
+    key = f"user:{user.pk}:is_hr"
+    is_hr = cache.get(key)
+    if is_hr is None:
+        is_hr = user.groups.filter(name='HR').exists()
+        cache.set(key, is_hr, 60)
+    return is_hr
+
+def _get_group(name: str) -> Group:
+    """Fetch one of the singleton auth groups (created by migration 0007),
+    cached for an hour so write paths skip the per-POST lookup."""
+    return cache.get_or_set(f"grp:{name}", lambda: Group.objects.get(name=name), 3600)
+
 def is_hr_or_superuser(user):
     """Check if user is HR staff or superuser."""
-    return user.is_authenticated and (user.is_superuser or user.groups.filter(name='HR').exists())
+    return user.is_authenticated and (user.is_superuser or _user_is_hr(user))
 
 def is_superuser(user):
     """Check if user is superuser."""
     return user.is_authenticated and user.is_superuser
 
-def can_access_employee(user, employee_id):
+def can_access_employee(user, employee_id, session=None):
     """Check if user can access this employee's data."""
     if not user.is_authenticated:
         return False
-    
-    if user.is_superuser or user.groups.filter(name='HR').exists():
+
+    if user.is_superuser or _user_is_hr(user):
         return True
-    
-    # Regular employees can only access their own data
+
+    # Regular employees can only access their own data. Their own id is
+    # stashed in the session at login so this is usually DB-free.
+    if session is not None and 'my_employee_id' in session:
+        return session['my_employee_id'] == employee_id
     try:
         profile = EmployeeProfile.objects.get(user=user)
-        return profile.employee_id == employee_id
     except EmployeeProfile.DoesNotExist:
         return False
+    if session is not None:
+        session['my_employee_id'] = profile.employee_id
+    return profile.employee_id == employee_id
 
 
 # ================= AUTHENTICATION VIEWS =================
@@ -63,15 +142,18 @@ def login_view(request):
         # Redirect based on user type
         if request.user.is_superuser:
             return redirect("admin:index")
-        elif request.user.groups.filter(name='HR').exists():
+        elif _user_is_hr(request.user):
             return redirect("employee_directory")
         else:
-            try:
-                profile = EmployeeProfile.objects.get(user=request.user)
-                return redirect("employee_dashboard", employee_id=profile.employee_id)
-            except EmployeeProfile.DoesNotExist:
-                pass
-    
+            # One flat lookup instead of pulling the whole profile row
+            emp_id = (
+                EmployeeProfile.objects.filter(user=request.user)
+                .values_list("employee_id", flat=True)
+                .first()
+            )
+            if emp_id:
+                return redirect("employee_dashboard", employee_id=emp_id)
+
     if request.method == "POST":
         username = request.POST.get("username")
         password = request.POST.get("password")
@@ -84,17 +166,22 @@ def login_view(request):
             # Redirect based on user type
             if user.is_superuser:
                 return redirect("admin:index")
-            elif user.groups.filter(name='HR').exists():
+            elif _user_is_hr(user):
                 return redirect("employee_directory")
             else:
                 # Regular employee - redirect to their dashboard
-                try:
-                    profile = EmployeeProfile.objects.get(user=user)
-                    return redirect("employee_dashboard", employee_id=profile.employee_id)
-                except EmployeeProfile.DoesNotExist:
-                    messages.error(request, "Employee profile not found.")
-                    logout(request)
-                    return redirect("login")
+                emp_id = (
+                    EmployeeProfile.objects.filter(user=user)
+                    .values_list("employee_id", flat=True)
+                    .first()
+                )
+                if emp_id:
+                    # Remember their own id so per-page access checks skip the DB
+                    request.session['my_employee_id'] = emp_id
+                    return redirect("employee_dashboard", employee_id=emp_id)
+                messages.error(request, "Employee profile not found.")
+                logout(request)
+                return redirect("login")
         else:
             messages.error(request, "Invalid username or password.")
     
@@ -137,22 +224,20 @@ def create_hr_user_view(request):
         full_name = request.POST.get("full_name", "")
         
         try:
-            # Create HR user
-            user = User.objects.create_user(
+            # Create HR user in a single INSERT, names included
+            first, _, last = full_name.partition(" ")
+            user = User(
                 username=username,
-                email=email,
-                password=password,
-                is_staff=True  # HR users are staff
+                email=User.objects.normalize_email(email),
+                first_name=first,
+                last_name=last,
+                is_staff=True,  # HR users are staff
             )
-            
-            first, *rest = full_name.split(" ", 1) if full_name else ["", ""]
-            user.first_name = first
-            user.last_name = rest[0] if rest else ""
+            user.set_password(password)
             user.save()
             
             # Add to HR group
-            hr_group, _ = Group.objects.get_or_create(name='HR')
-            user.groups.add(hr_group)
+            user.groups.add(_get_group('HR'))
             
             messages.success(request, f"HR user '{username}' created successfully.")
             return redirect("create_hr_user")
@@ -170,22 +255,35 @@ def index(request):
     if request.user.is_authenticated:
         if request.user.is_superuser:
             return redirect("admin:index")
-        elif request.user.groups.filter(name='HR').exists():
+        elif _user_is_hr(request.user):
             return redirect("employee_directory")
         else:
-            try:
-                profile = EmployeeProfile.objects.get(user=request.user)
-                return redirect("employee_dashboard", employee_id=profile.employee_id)
-            except EmployeeProfile.DoesNotExist:
-                pass
+            emp_id = (
+                EmployeeProfile.objects.filter(user=request.user)
+                .values_list("employee_id", flat=True)
+                .first()
+            )
+            if emp_id:
+                return redirect("employee_dashboard", employee_id=emp_id)
     return redirect("login")
 
 
 @login_required
 @user_passes_test(is_hr_or_superuser)
+@cache_page(30)
+@vary_on_cookie
 def employee_directory_view(request):
     """Display all employees in a directory/grid view."""
-    employees = EmployeeProfile.objects.select_related('employeepersonalinfo').all()
+    # The grid template only renders these fields, so trim the SELECT to them
+    employees = EmployeeProfile.objects.select_related('employeepersonalinfo').only(
+        'employee_id',
+        'department',
+        'job_title',
+        'employment_type',
+        'status',
+        'employeepersonalinfo__full_name',
+        'employeepersonalinfo__email',
+    )
     context = {
         'employees': employees,
     }
@@ -195,23 +293,16 @@ def employee_directory_view(request):
 def _generate_next_employee_id() -> str:
     """Generate the next employee ID like EMP-001, EMP-002, ..."""
 
-    last_profile = (
-        EmployeeProfile.objects.filter(employee_id__startswith="EMP-")
-        .order_by("-id")
-        .first()
+    # Push the numeric-suffix max to the DB so we read a single integer
+    # instead of pulling a whole row and parsing it in Python.
+    last_number = (
+        EmployeeProfile.objects.filter(employee_id__regex=r"^EMP-\d+$")
+        .annotate(number=Cast(Substr("employee_id", 5), IntegerField()))
+        .aggregate(max_number=Max("number"))["max_number"]
+        or 0
     )
 
-    if not last_profile:
-        return "EMP-001"
-
-    last_id = last_profile.employee_id or ""
-    try:
-        number_part = int(last_id.split("-")[-1])
-    except (ValueError, TypeError):
-        # Fallback if existing IDs don't match the pattern cleanly
-        return "EMP-001"
-
-    return f"EMP-{number_part + 1:03d}"
+    return f"EMP-{last_number + 1:03d}"
 
 
 @transaction.atomic
@@ -231,49 +322,31 @@ def employee_onboarding_view(request):
         # Generate a random temporary password
         temp_password = secrets.token_urlsafe(12)
 
-        # Create user with temporary password
-        user = User.objects.create_user(
+        # Create user with temporary password; build the row fully before
+        # saving so the name fields don't cost a second UPDATE
+        first, _, last = full_name.partition(" ")
+        user = User(
             username=username,
-            email=email,
-            password=temp_password,
-            is_staff=False  # Employees are not staff by default
+            email=User.objects.normalize_email(email),
+            first_name=first,
+            last_name=last,
+            is_staff=False,  # Employees are not staff by default
         )
-        
-        first, *rest = full_name.split(" ", 1)
-        user.first_name = first
-        user.last_name = rest[0] if rest else ""
+        user.set_password(temp_password)
         user.save()
 
         # Add user to Employee group
-        employee_group, _ = Group.objects.get_or_create(name='Employee')
-        user.groups.add(employee_group)
+        user.groups.add(_get_group('Employee'))
 
         # Employee profile
-        from datetime import date
-
-        join_date_str = data.get("join_date") or None
-        join_date = None
-        if join_date_str:
-            try:
-                join_date = date.fromisoformat(join_date_str)
-            except ValueError:
-                join_date = None
+        join_date = _parse_date(data.get("join_date"))
 
         # Map employment type text to model choice key if possible
-        employment_type_map = {
-            "full time": "FULL_TIME",
-            "part time": "PART_TIME",
-            "contract": "CONTRACT",
-        }
         employment_type_raw = (data.get("employment_type") or "").lower()
-        employment_type = employment_type_map.get(employment_type_raw, "FULL_TIME")
+        employment_type = _EMPLOYMENT_TYPE_MAP.get(employment_type_raw, "FULL_TIME")
 
-        status_map = {
-            "active": "ACTIVE",
-            "inactive": "INACTIVE",
-        }
         status_raw = (data.get("employment_status") or "").lower()
-        status = status_map.get(status_raw, "ACTIVE")
+        status = _STATUS_MAP.get(status_raw, "ACTIVE")
 
         profile = EmployeeProfile.objects.create(
             user=user,
@@ -287,15 +360,9 @@ def employee_onboarding_view(request):
         )
 
         # Personal info
-        dob_str = data.get("date_of_birth") or None
-        dob = None
-        if dob_str:
-            try:
-                dob = date.fromisoformat(dob_str)
-            except ValueError:
-                dob = None
+        dob = _parse_date(data.get("date_of_birth"))
 
-        EmployeePersonalInfo.objects.create(
+        personal_info = EmployeePersonalInfo(
             employee=profile,
             full_name=full_name,
             gender=(data.get("gender") or "OTHER").upper(),
@@ -309,7 +376,7 @@ def employee_onboarding_view(request):
         )
 
         # Onboarding record
-        EmployeeOnboarding.objects.create(
+        onboarding = EmployeeOnboarding(
             employee=profile,
             manager=request.user if request.user.is_authenticated else None,
             joining_date=join_date or date.today(),
@@ -319,7 +386,7 @@ def employee_onboarding_view(request):
         )
 
         # Initial job history
-        JobHistory.objects.create(
+        job_history = JobHistory(
             employee=profile,
             effective_date=join_date or date.today(),
             job_title=data.get("job_title") or "",
@@ -329,21 +396,10 @@ def employee_onboarding_view(request):
         )
 
         # Employment contract
-        start_str = data.get("contract_start") or None
-        end_str = data.get("contract_end") or None
-        start_date = end_date = None
-        if start_str:
-            try:
-                start_date = date.fromisoformat(start_str)
-            except ValueError:
-                start_date = None
-        if end_str:
-            try:
-                end_date = date.fromisoformat(end_str)
-            except ValueError:
-                end_date = None
+        start_date = _parse_date(data.get("contract_start"))
+        end_date = _parse_date(data.get("contract_end"))
 
-        EmploymentContract.objects.create(
+        contract = EmploymentContract(
             employee=profile,
             contract_number=data.get("contract_number") or "",
             contract_name=data.get("contract_name") or "",
@@ -353,14 +409,14 @@ def employee_onboarding_view(request):
         )
 
         # Work schedule
-        WorkSchedule.objects.create(
+        schedule = WorkSchedule(
             employee=profile,
             working_hours=data.get("working_hours") or "9:00am - 5:00pm",
             working_days=data.get("working_days") or "Monday - Friday",
         )
 
         # Bank details
-        BankDetail.objects.create(
+        bank_detail = BankDetail(
             employee=profile,
             bank_name=data.get("bank_name") or "",
             account_title=data.get("account_title") or full_name,
@@ -369,21 +425,31 @@ def employee_onboarding_view(request):
             payment_frequency=data.get("payment_frequency") or "MONTHLY",
         )
 
-        # Salary components: map from onboarding fields
+        # Insert the related records in one batch per model (no cross-model
+        # batching in the ORM, but this keeps each INSERT out of autocommit
+        # and skips per-instance save() overhead)
+        for record in (personal_info, onboarding, job_history, contract, schedule, bank_detail):
+            type(record).objects.bulk_create([record])
+
+        # Salary components: map from onboarding fields, batched into one INSERT
+        components = []
+
         def create_component(field_name: str, label: str, component_type: str):
             raw = data.get(field_name)
             if raw:
+                # Decimal straight away: the model field is a DecimalField, so
+                # going through float would just add a lossy conversion step
                 try:
-                    amount = float(
-                        raw.replace(",", "").replace("Rs.", "").replace(" ", "")
-                    )
-                except ValueError:
+                    amount = Decimal(raw.replace("Rs.", "").translate(_SALARY_TRANS))
+                except InvalidOperation:
                     return
-                SalaryComponent.objects.create(
-                    employee=profile,
-                    name=label,
-                    amount=amount,
-                    component_type=component_type,
+                components.append(
+                    SalaryComponent(
+                        employee=profile,
+                        name=label,
+                        amount=amount,
+                        component_type=component_type,
+                    )
                 )
 
         create_component("basic_salary", "Basic Salary", "EARNING")
@@ -394,27 +460,41 @@ def employee_onboarding_view(request):
         create_component("tax_deduction", "Tax Deduction", "DEDUCTION")
         create_component("loan_deduction", "Loan Deduction", "DEDUCTION")
 
-        # Documents uploaded at onboarding time
+        if components:
+            SalaryComponent.objects.bulk_create(components)
+
+        # Documents uploaded at onboarding time, inserted in one batch
+        # (bulk_create still runs the FileField upload hook per instance)
+        documents = []
+        uploaded_by = request.user if request.user.is_authenticated else None
+
         cnic_file = request.FILES.get("cnic_file")
         if cnic_file:
-            EmployeeDocument.objects.create(
-                employee=profile,
-                name="CNIC / ID Copy",
-                category="IDENTITY",
-                file=cnic_file,
-                uploaded_by=request.user if request.user.is_authenticated else None,
+            documents.append(
+                EmployeeDocument(
+                    employee=profile,
+                    name="CNIC / ID Copy",
+                    category="IDENTITY",
+                    file=cnic_file,
+                    uploaded_by=uploaded_by,
+                )
             )
 
         contract_file = request.FILES.get("contract_file")
         if contract_file:
-            EmployeeDocument.objects.create(
-                employee=profile,
-                name="Employment Contract / Offer Letter",
-                category="CONTRACT",
-                file=contract_file,
-                uploaded_by=request.user if request.user.is_authenticated else None,
+            documents.append(
+                EmployeeDocument(
+                    employee=profile,
+                    name="Employment Contract / Offer Letter",
+                    category="CONTRACT",
+                    file=contract_file,
+                    uploaded_by=uploaded_by,
+                )
             )
 
+        if documents:
+            EmployeeDocument.objects.bulk_create(documents)
+
         # Enroll facial data with external face recognition API
         face_images = [img for img in request.FILES.getlist("face_images") if img]
         if face_images:
@@ -422,13 +502,12 @@ def employee_onboarding_view(request):
                 # Use employee_id as the canonical person_name for matching
                 # face_api.add_person(profile.employee_id, face_images)
                 face_api.add_person(full_name, face_images)
-                # Rebuild internal index and run migrations after enrollment
-                try:
-                    face_api.rebuild_db()
-                    face_api.migrate()
-                except face_api.FaceAPIError:
-                    # Non-critical; enrollment already done, can retry later
-                    pass
+                # Rebuild internal index and run migrations in the background;
+                # non-critical, and they can take seconds on the face backend.
+                # Scheduled after commit so a rolled-back onboarding never
+                # triggers an index rebuild for a person that was not saved.
+                transaction.on_commit(face_api.rebuild_db_async)
+                transaction.on_commit(face_api.migrate_async)
                 messages.success(request, "Facial data enrolled for attendance.")
             except face_api.FaceAPIError as exc:
                 messages.warning(
@@ -441,6 +520,11 @@ def employee_onboarding_view(request):
                 "Employee created but no facial images were uploaded for attendance enrollment.",
             )
 
+        # The suggested ID on the form is stale now that this one is taken,
+        # and any cached context for a re-used employee id must go too
+        cache.delete("next_employee_id")
+        cache.delete(f"emp:ctx:{employee_id}")
+
         # Store temporary password in session for display
         request.session['new_employee_credentials'] = {
             'username': username,
@@ -452,8 +536,9 @@ def employee_onboarding_view(request):
         # Redirect to the employee directory
         return redirect("employee_general", employee_id=profile.employee_id)
 
-    # GET: just render the static onboarding form
-    default_employee_id = _generate_next_employee_id()
+    # GET: just render the static onboarding form; cache the suggested ID
+    # briefly so repeated form renders skip the aggregate query
+    default_employee_id = cache.get_or_set("next_employee_id", _generate_next_employee_id, 30)
     return render(
         request,
         "adminPages/employee_onboarding.html",
@@ -461,8 +546,56 @@ def employee_onboarding_view(request):
     )
 
 
-def _get_employee_or_404(employee_id: str) -> EmployeeProfile:
-    return get_object_or_404(EmployeeProfile, employee_id=employee_id)
+def _format_time(dt) -> str:
+    """Render an aware datetime as "9:05 AM" (placeholder when missing)."""
+    if not dt:
+        return "--:--"
+    local_dt = timezone.localtime(dt)
+    formatted = local_dt.strftime("%I:%M %p")
+    # Drop only a leading zero hour; lstrip would also eat "00" minutes
+    return formatted[1:] if formatted[0] == "0" else formatted
+
+
+# Profile columns the admin tab headers actually render; used to narrow
+# fetches on views that never write the employee row itself
+_EMPLOYEE_CARD_FIELDS = (
+    "employee_id",
+    "department",
+    "job_title",
+    "office",
+    "employment_type",
+    "status",
+    "join_date",
+    "exit_date",
+)
+
+
+def _get_employee_or_404(
+    employee_id: str, with_related: bool = False, fields: tuple = ()
+) -> EmployeeProfile:
+    qs = EmployeeProfile.objects.all()
+    if with_related:
+        # Join the 1:1 records up front so the _cached_rel probes below
+        # don't each fire their own SELECT.
+        qs = qs.select_related(
+            "user", "employeepersonalinfo", "workschedule", "bankdetail", "onboarding"
+        )
+    if fields:
+        # Only safe on read paths: deferred columns reload lazily on access
+        qs = qs.only(*fields)
+    return get_object_or_404(qs, employee_id=employee_id)
+
+
+def _cached_rel(obj, name: str):
+    """Return a 1:1 relation, preferring the select_related cache.
+
+    When the relation was joined up front this is a pure dict lookup;
+    otherwise it falls back to the descriptor (which may query).
+    """
+    cache = obj._state.fields_cache
+    if name in cache:
+        return cache[name]
+    return getattr(obj, name, None)
 
 
 def _mask_account(number: str) -> str:
@@ -471,14 +604,13 @@ def _mask_account(number: str) -> str:
     num = str(number)
     if len(num) <= 2:
         return num
-    return num[:2] + "*" * (len(num) - 2)
+    # ljust pads with stars in one pass, no intermediate "*" * n string
+    return num[:2].ljust(len(num), "*")
 
 
 def _parse_date(date_str):
     if not date_str:
         return None
-    from datetime import date
-
     try:
         return date.fromisoformat(date_str)
     except ValueError:
@@ -515,74 +647,85 @@ def _leave_balances_for_employee(employee: EmployeeProfile):
     return balances
 
 
-def _ensure_current_month_payroll(employee: EmployeeProfile) -> Payroll | None:
-    """Guarantee a payroll exists for the current month; create it if missing."""
-    from datetime import date
-    from calendar import monthrange
-    from django.db.models import Sum
+def _ensure_current_month_payroll(
+    employee: EmployeeProfile, totals: tuple | None = None
+) -> Payroll | None:
+    """Guarantee a payroll exists for the current month; create it if missing.
 
+    Returns the payroll only when one had to be created; callers just need
+    the side effect, so the common hit path is a single EXISTS query.
+    Callers that already aggregated the salary components can pass the
+    (earnings_total, deductions_total) pair to skip the aggregate here.
+    """
     today = date.today()
-    existing = Payroll.objects.filter(
-        employee=employee, period_end__year=today.year, period_end__month=today.month
-    ).first()
-    if existing:
-        return existing
+    days_in_month = monthrange(today.year, today.month)[1]
+    period_start = date(today.year, today.month, 1)
 
-    earnings_total = (
-        SalaryComponent.objects.filter(employee=employee, component_type="EARNING")
-        .aggregate(total=Sum("amount"))
-        .get("total")
-        or 0
-    )
-    deductions_total = (
-        SalaryComponent.objects.filter(employee=employee, component_type="DEDUCTION")
-        .aggregate(total=Sum("amount"))
-        .get("total")
-        or 0
-    )
+    # Month-scoped guard: once a request has verified this employee's
+    # payroll exists, later hits the same month skip the DB entirely. The
+    # key is only set after the ensure succeeds, so a failed attempt (e.g.
+    # a locked database) leaves the next request free to retry; it expires
+    # with the month.
+    guard_key = f"payroll:ensured:{employee.pk}:{period_start:%Y-%m}"
+    guard_timeout = ((days_in_month - today.day) + 1) * 86400
+    if cache.get(guard_key):
+        return None
 
-    period_start = date(today.year, today.month, 1)
-    period_end = date(today.year, today.month, monthrange(today.year, today.month)[1])
+    if Payroll.objects.filter(employee=employee, period_start=period_start).exists():
+        cache.set(guard_key, True, guard_timeout)
+        return None
+
+    if totals is None:
+        # Both sums in one round-trip via conditional aggregation
+        aggregated = SalaryComponent.objects.filter(employee=employee).aggregate(
+            earnings=Sum("amount", filter=Q(component_type="EARNING")),
+            deductions=Sum("amount", filter=Q(component_type="DEDUCTION")),
+        )
+        totals = (aggregated["earnings"], aggregated["deductions"])
+    earnings_total = totals[0] or 0
+    deductions_total = totals[1] or 0
+
+    period_end = date(today.year, today.month, days_in_month)
     payment_method = "Bank Transfer"
 
-    bank = getattr(employee, "bankdetail", None)
+    bank = _cached_rel(employee, "bankdetail")
     if bank and getattr(bank, "payment_frequency", None):
         payment_method = f"Bank Transfer ({bank.payment_frequency.title()})"
 
-    return Payroll.objects.create(
+    # get_or_create + the unique (employee, period_start) constraint keep
+    # two concurrent requests from inserting the month twice
+    payroll, _ = Payroll.objects.get_or_create(
         employee=employee,
         period_start=period_start,
-        period_end=period_end,
-        total_earnings=earnings_total,
-        total_deductions=deductions_total,
-        net_salary=earnings_total - deductions_total,
-        payment_method=payment_method,
-        payment_date=today,
+        defaults={
+            "period_end": period_end,
+            "total_earnings": earnings_total,
+            "total_deductions": deductions_total,
+            "net_salary": earnings_total - deductions_total,
+            "payment_method": payment_method,
+            "payment_date": today,
+        },
     )
+    cache.set(guard_key, True, guard_timeout)
+    return payroll
 
 
 def employee_dashboard_view(request, employee_id):
     """Display employee dashboard."""
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
 
     # Attendance snapshot for today
     today = timezone.localdate()
     now = timezone.localtime()
     attendance = EmployeeAttendance.objects.filter(employee=employee, date=today).first()
 
-    def _fmt_time(dt):
-        if not dt:
-            return "--:--"
-        local_dt = timezone.localtime(dt)
-        return local_dt.strftime("%I:%M %p").lstrip("0")
-
-    check_in_display = _fmt_time(attendance.check_in) if attendance else "--:--"
-    check_out_display = _fmt_time(attendance.check_out) if attendance else "--:--"
+    check_in_display = _format_time(attendance.check_in) if attendance else "--:--"
+    check_out_display = _format_time(attendance.check_out) if attendance else "--:--"
 
     total_hours_display = "0h 00m"
     if attendance and attendance.total_duration:
@@ -599,9 +742,7 @@ def employee_dashboard_view(request, employee_id):
             attendance_status = "In Progress"
 
     # Schedule snapshot
-    from datetime import timedelta
-
-    schedule = getattr(employee, "workschedule", None)
+    schedule = _cached_rel(employee, "workschedule")
     shift_hours = schedule.working_hours if schedule and schedule.working_hours else "9:00 AM - 5:00 PM"
     working_days = schedule.working_days if schedule and schedule.working_days else "Monday - Friday"
 
@@ -655,12 +796,12 @@ def employee_dashboard_view(request, employee_id):
     return render(request, "employeePages/employee_dashboard.html", context)
 
 def employee_leaves_view(request, employee_id):
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
     
     if request.method == "POST":
         action = request.POST.get("action", "create")
@@ -856,13 +997,21 @@ def hr_leave_requests_view(request):
 
 def employee_general_view(request, employee_id):
     """Display employee general/personal information."""
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
-    
+    # Profile + personal info change rarely; cache the pair and invalidate
+    # from the write paths (onboarding, admin general edit).
+    ctx_key = f"emp:ctx:{employee_id}"
+    cached = cache.get(ctx_key)
+    if cached is None:
+        employee = _get_employee_or_404(employee_id, with_related=True)
+        personal = _cached_rel(employee, "employeepersonalinfo")
+        cache.set(ctx_key, (employee, personal), 60)
+    else:
+        employee, personal = cached
+
     # Check if there are new employee credentials to display
     credentials = request.session.pop('new_employee_credentials', None)
     
@@ -875,20 +1024,23 @@ def employee_general_view(request, employee_id):
 
 
 def employee_job_view(request, employee_id):
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
+    employee = _get_employee_or_404(employee_id, with_related=True)
     job_history = JobHistory.objects.filter(employee=employee).order_by("-effective_date")
     contracts = EmploymentContract.objects.filter(employee=employee).order_by("-start_date")
-    schedule = getattr(employee, "workschedule", None)
-    from datetime import date
+    schedule = _cached_rel(employee, "workschedule")
 
-    today = date.today()
+    today = request.today
     service_years = None
     if employee.join_date:
-        service_years = (today - employee.join_date).days // 365
+        # Calendar-accurate and cheaper than timedelta division
+        join = employee.join_date
+        service_years = today.year - join.year - (
+            (today.month, today.day) < (join.month, join.day)
+        )
     context = {
         "employee": employee,
         "job_history": job_history,
@@ -900,24 +1052,40 @@ def employee_job_view(request, employee_id):
 
 
 def employee_payroll_view(request, employee_id):
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
-    earnings = SalaryComponent.objects.filter(employee=employee, component_type="EARNING")
-    deductions = SalaryComponent.objects.filter(employee=employee, component_type="DEDUCTION")
-    bank = getattr(employee, "bankdetail", None)
-    _ensure_current_month_payroll(employee)
-    payroll_history = Payroll.objects.filter(employee=employee).order_by("-payment_date")
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    bank = _cached_rel(employee, "bankdetail")
 
-    last_pay = payroll_history.first()
+    # The template only reads .name/.amount, so skip model instantiation:
+    # one namedtuple fetch, partitioned and totalled in a single pass
+    rows = SalaryComponent.objects.filter(employee=employee).values_list(
+        "id", "name", "amount", "component_type", named=True
+    )
+    earnings = []
+    deductions = []
+    earnings_total = Decimal("0")
+    deductions_total = Decimal("0")
+    for row in rows:
+        if row.component_type == "EARNING":
+            earnings.append(row)
+            earnings_total += row.amount
+        else:
+            deductions.append(row)
+            deductions_total += row.amount
 
-    from django.db.models import Sum
+    # Reuse the totals we just computed so the ensure step never re-aggregates
+    _ensure_current_month_payroll(employee, totals=(earnings_total, deductions_total))
+
+    # Materialize once: .first() on the lazy queryset would re-run the
+    # query the template executes again when it iterates the history.
+    payroll_history = list(
+        Payroll.objects.filter(employee=employee).order_by("-payment_date")
+    )
+    last_pay = payroll_history[0] if payroll_history else None
 
-    earnings_total = earnings.aggregate(total=Sum("amount"))["total"] or 0
-    deductions_total = deductions.aggregate(total=Sum("amount"))["total"] or 0
-    
     # Calculate what the net salary will be for future payslips
     calculated_net_salary = earnings_total - deductions_total
 
@@ -937,7 +1105,7 @@ def employee_payroll_view(request, employee_id):
 
 def employee_payslip_list_view(request, employee_id):
     """Display a list of all payslips for an employee."""
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
@@ -945,10 +1113,13 @@ def employee_payslip_list_view(request, employee_id):
     if is_hr_or_superuser(request.user):
         return redirect("employee_payslip_list_admin", employee_id=employee_id)
     
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
     _ensure_current_month_payroll(employee)
-    payroll_records = Payroll.objects.filter(employee=employee).order_by("-payment_date")
+    # Read-only listing: plain dicts skip model instantiation per row
+    payroll_records = Payroll.objects.filter(employee=employee).order_by("-payment_date").values(
+        "id", "period_start", "period_end", "net_salary", "payment_date"
+    )
 
     context = {
         "employee": employee,
@@ -960,20 +1131,19 @@ def employee_payslip_list_view(request, employee_id):
 
 def employee_payslip_detail_view(request, employee_id, payroll_id):
     """Display a single payslip detail."""
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
-    bank = getattr(employee, "bankdetail", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
+    bank = _cached_rel(employee, "bankdetail")
 
     payroll = get_object_or_404(Payroll, employee=employee, id=payroll_id)
 
     # Only show component breakdown for current month's payslip
     # Past payslips will only show totals to prevent showing updated values
-    from datetime import date
-    today = date.today()
+    today = request.today
     is_current_month = (payroll.period_end.year == today.year and 
                         payroll.period_end.month == today.month)
     
@@ -998,12 +1168,17 @@ def employee_payslip_detail_view(request, employee_id, payroll_id):
 
 
 def employee_documents_view(request, employee_id):
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
     
-    employee = _get_employee_or_404(employee_id)
-    documents = EmployeeDocument.objects.filter(employee=employee).order_by("-uploaded_at")
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    # The list template only shows name + file link; keep instances light
+    documents = (
+        EmployeeDocument.objects.filter(employee=employee)
+        .only("name", "category", "file", "uploaded_at")
+        .order_by("-uploaded_at")
+    )
 
     if request.method == "POST":
         form = EmployeeDocumentForm(request.POST, request.FILES)
@@ -1026,12 +1201,12 @@ def employee_documents_view(request, employee_id):
 
 def employee_attendance_view(request, employee_id):
     """Track daily attendance for an employee (check-in / check-out)."""
-    if not can_access_employee(request.user, employee_id):
+    if not can_access_employee(request.user, employee_id, request.session):
         messages.error(request, "You don't have permission to access this page.")
         return redirect("login")
 
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
 
     today = timezone.localdate()
     now = timezone.localtime()
@@ -1044,8 +1219,13 @@ def employee_attendance_view(request, employee_id):
     def _decode_base64_image(data_uri: str) -> bytes:
         if not data_uri:
             raise ValueError("No image data provided")
-        if "," in data_uri:
-            data_uri = data_uri.split(",", 1)[1]
+        # Bound the work before decoding ~2MB of webcam frame
+        if len(data_uri) > _MAX_CAPTURE_B64_LEN:
+            raise ValueError("Captured image is too large")
+        # Slice past the data-URI prefix instead of split()'s two-element copy
+        comma = data_uri.find(",")
+        if comma >= 0:
+            data_uri = data_uri[comma + 1:]
         return base64.b64decode(data_uri)
 
     if request.method == "POST":
@@ -1118,12 +1298,6 @@ def employee_attendance_view(request, employee_id):
         return redirect("employee_attendance", employee_id=employee.employee_id)
 
     # Prepare display values
-    def _format_time(dt):
-        if not dt:
-            return "--:--"
-        local_dt = timezone.localtime(dt)
-        return local_dt.strftime("%I:%M %p").lstrip("0")
-
     check_in_display = _format_time(attendance.check_in)
     check_out_display = _format_time(attendance.check_out)
 
@@ -1208,22 +1382,17 @@ def employee_attendance_view(request, employee_id):
 @user_passes_test(is_hr_or_superuser)
 def employee_general_admin_view(request, employee_id):
     """Admin view for editing employee general/personal information."""
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
     
     if request.method == "POST":
         # Update personal info
         if personal:
-            personal.full_name = request.POST.get("full_name", personal.full_name)
-            personal.gender = request.POST.get("gender", personal.gender)
-            personal.date_of_birth = request.POST.get("date_of_birth", personal.date_of_birth)
-            personal.email = request.POST.get("email", personal.email)
-            personal.phone_number = request.POST.get("phone_number", personal.phone_number)
-            personal.marital_status = request.POST.get("marital_status", personal.marital_status)
-            personal.personal_id = request.POST.get("personal_id", personal.personal_id)
-            personal.emergency_contact = request.POST.get("emergency_contact", personal.emergency_contact)
-            personal.save()
-        
+            changed = _assign_posted(personal, _PERSONAL_FIELDS, request.POST)
+            if changed:
+                personal.save(update_fields=changed)
+                cache.delete(f"emp:ctx:{employee.employee_id}")
+
         return redirect("employee_general_admin", employee_id=employee.employee_id)
     
     context = {
@@ -1237,40 +1406,47 @@ def employee_general_admin_view(request, employee_id):
 @user_passes_test(is_hr_or_superuser)
 def employee_job_admin_view(request, employee_id):
     """Admin view for editing employee job information."""
-    employee = _get_employee_or_404(employee_id)
+    employee = _get_employee_or_404(employee_id, with_related=True)
     job_history = JobHistory.objects.filter(employee=employee).order_by("-effective_date")
     contracts = EmploymentContract.objects.filter(employee=employee).order_by("-start_date")
-    schedule = getattr(employee, "workschedule", None)
-    
-    from datetime import date
-    today = date.today()
+    schedule = _cached_rel(employee, "workschedule")
+
+    today = request.today
     service_years = None
     if employee.join_date:
-        service_years = (today - employee.join_date).days // 365
+        # Calendar-accurate and cheaper than timedelta division
+        join = employee.join_date
+        service_years = today.year - join.year - (
+            (today.month, today.day) < (join.month, join.day)
+        )
     
     if request.method == "POST":
         # Update employee profile
-        employee.job_title = request.POST.get("job_title", employee.job_title)
-        employee.department = request.POST.get("department", employee.department)
-        employee.office = request.POST.get("office", employee.office)
-        employee.employment_type = request.POST.get("employment_type", employee.employment_type)
-        employee.status = request.POST.get("status", employee.status)
-        
+        changed = _assign_posted(employee, _JOB_FIELDS, request.POST)
+
         join_date_str = request.POST.get("join_date")
         if join_date_str:
             try:
                 employee.join_date = date.fromisoformat(join_date_str)
+                changed.append("join_date")
             except ValueError:
                 pass
-        
-        employee.save()
-        
-        # Update work schedule
-        if schedule:
-            schedule.working_hours = request.POST.get("working_hours", schedule.working_hours)
-            schedule.working_days = request.POST.get("working_days", schedule.working_days)
-            schedule.save()
-        
+
+        schedule_changed = (
+            _assign_posted(schedule, _SCHEDULE_FIELDS, request.POST) if schedule else []
+        )
+
+        # Commit the profile + schedule writes together instead of one
+        # autocommit round per save
+        with transaction.atomic():
+            if changed:
+                employee.save(update_fields=changed)
+            if schedule_changed:
+                schedule.save(update_fields=schedule_changed + ["updated_at"])
+        if changed:
+            # The general page renders job fields off this cached profile
+            cache.delete(f"emp:ctx:{employee.employee_id}")
+
         return redirect("employee_job_admin", employee_id=employee.employee_id)
     
     context = {
@@ -1287,46 +1463,57 @@ def employee_job_admin_view(request, employee_id):
 @user_passes_test(is_hr_or_superuser)
 def employee_payroll_admin_view(request, employee_id):
     """Admin view for editing employee payroll information."""
-    employee = _get_employee_or_404(employee_id)
-    earnings = SalaryComponent.objects.filter(employee=employee, component_type="EARNING")
-    deductions = SalaryComponent.objects.filter(employee=employee, component_type="DEDUCTION")
-    bank = getattr(employee, "bankdetail", None)
-    _ensure_current_month_payroll(employee)
-    payroll_history = Payroll.objects.filter(employee=employee).order_by("-payment_date")
-    last_pay = payroll_history.first()
-    
-    from django.db.models import Sum
-    earnings_total = earnings.aggregate(total=Sum("amount"))["total"] or 0
-    deductions_total = deductions.aggregate(total=Sum("amount"))["total"] or 0
-    
+    # POST here writes bank + components, never the employee row, so the
+    # narrow projection is safe
+    employee = _get_employee_or_404(employee_id, fields=_EMPLOYEE_CARD_FIELDS)
+    # One component fetch; the POST loops, the totals and the template all
+    # work off the same materialized rows instead of re-running filters
+    components = list(SalaryComponent.objects.filter(employee=employee))
+    earnings = [c for c in components if c.component_type == "EARNING"]
+    deductions = [c for c in components if c.component_type == "DEDUCTION"]
+    earnings_total = sum(c.amount for c in earnings) or 0
+    deductions_total = sum(c.amount for c in deductions) or 0
+
+    bank = _cached_rel(employee, "bankdetail")
+    _ensure_current_month_payroll(employee, totals=(earnings_total, deductions_total))
+    # Materialize once; .first() would add a LIMIT 1 query on top of the
+    # template's iteration
+    payroll_history = list(
+        Payroll.objects.filter(employee=employee).order_by("-payment_date")
+    )
+    last_pay = payroll_history[0] if payroll_history else None
+
+
     if request.method == "POST":
-        # Update bank details
-        if bank:
-            bank.bank_name = request.POST.get("bank_name", bank.bank_name)
-            bank.account_title = request.POST.get("account_title", bank.account_title)
-            bank.account_number = request.POST.get("account_number", bank.account_number)
-            bank.iban = request.POST.get("iban", bank.iban)
-            bank.payment_frequency = request.POST.get("payment_frequency", bank.payment_frequency)
-            bank.save()
-        
-        # Update salary components (simplified - just update existing ones)
+        # Update salary components (simplified - just update existing ones),
+        # collecting changes for a single bulk UPDATE
+        bank_changed = _assign_posted(bank, _BANK_FIELDS, request.POST) if bank else []
+
+        changed = []
         for earning in earnings:
             amount_key = f"earning_{earning.id}"
             if amount_key in request.POST:
                 try:
-                    earning.amount = float(request.POST[amount_key])
-                    earning.save()
-                except ValueError:
-                    pass
-        
+                    earning.amount = Decimal(request.POST[amount_key])
+                except InvalidOperation:
+                    continue
+                changed.append(earning)
+
         for deduction in deductions:
             amount_key = f"deduction_{deduction.id}"
             if amount_key in request.POST:
                 try:
-                    deduction.amount = float(request.POST[amount_key])
-                    deduction.save()
-                except ValueError:
-                    pass
+                    deduction.amount = Decimal(request.POST[amount_key])
+                except InvalidOperation:
+                    continue
+                changed.append(deduction)
+
+        # One commit for the bank row and the component batch
+        with transaction.atomic():
+            if bank_changed:
+                bank.save(update_fields=bank_changed)
+            if changed:
+                SalaryComponent.objects.bulk_update(changed, ["amount"])
         
         # Do NOT update existing payroll records
         # Only future months will have updated values when new payslips are generated
@@ -1355,8 +1542,8 @@ def employee_payroll_admin_view(request, employee_id):
 @user_passes_test(is_hr_or_superuser)
 def employee_payslip_list_admin_view(request, employee_id):
     """Admin view for displaying employee payslips."""
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
     _ensure_current_month_payroll(employee)
     payroll_records = Payroll.objects.filter(employee=employee).order_by("-payment_date")
 
@@ -1372,7 +1559,7 @@ def employee_payslip_list_admin_view(request, employee_id):
 @user_passes_test(is_hr_or_superuser)
 def employee_documents_admin_view(request, employee_id):
     """Admin view for managing employee documents."""
-    employee = _get_employee_or_404(employee_id)
+    employee = _get_employee_or_404(employee_id, with_related=True)
     documents = EmployeeDocument.objects.filter(employee=employee).order_by("-uploaded_at")
 
     if request.method == "POST" and request.FILES.get("file"):
@@ -1393,111 +1580,144 @@ def employee_documents_admin_view(request, employee_id):
     return render(request, "adminPages/employee4_admin.html", context)
 
 
-def employee_schedule_view(request, employee_id):
-    """Employee schedule page with real current dates for the week."""
-    if not can_access_employee(request.user, employee_id):
-        messages.error(request, "You don't have permission to access this page.")
-        return redirect("login")
-
-    from datetime import timedelta
-
-    employee = _get_employee_or_404(employee_id)
-    personal = getattr(employee, "employeepersonalinfo", None)
-    schedule = getattr(employee, "workschedule", None)
+_DAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
 
-    today = timezone.localdate()
-    now = timezone.localtime()
-
-    # Determine current week (Monday to Sunday)
-    start_of_week = today - timedelta(days=today.weekday())
-    end_of_week = start_of_week + timedelta(days=6)
-
-    week_range_label = f"{start_of_week.strftime('%b %d')} - {end_of_week.strftime('%b %d')}"
+# Constant label lookups for the week grid; strftime re-walks its format
+# string (and consults locale) on every call
+_WEEKDAY_SHORT = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+_MONTH_ABBR = (
+    "", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
 
-    default_shift_hours = "9:00 AM - 5:00 PM"
-    shift_hours = schedule.working_hours if schedule and schedule.working_hours else default_shift_hours
 
-    # Parse shift hours for today's scheduled times
+@lru_cache(maxsize=512)
+def _working_mask(working_days: str | None) -> int:
+    """Weekday bitmask (bit 0 = Monday) for a working-days string.
+
+    Parsed once per distinct string; the weekly loop then tests a bit
+    instead of rescanning the text per day.
+    """
+    if not working_days:
+        return 0b0011111  # default Mon-Fri
+    s = working_days.lower()
+    # Ranges like "Monday - Friday" mean all weekdays
+    if "monday" in s and "friday" in s:
+        return 0b0011111
+    mask = 0
+    for i, name in enumerate(_DAY_NAMES):
+        if name in s:
+            mask |= 1 << i
+    return mask
+
+
+@lru_cache(maxsize=512)
+def _parse_shift(shift_hours: str) -> tuple:
+    """Parse a working-hours string like "9:00 AM - 5:00 PM".
+
+    Returns (start, end, total-hours label, late-threshold label,
+    late-threshold time object). Pure on its input, so results are
+    memoized — the distinct shift strings across all schedules form a
+    tiny set.
+    """
     today_start = "9:00 AM"
     today_end = "5:00 PM"
     today_total_hours = "8h 00m"
     late_threshold_time = "9:15 AM"
-    
+    threshold_time_obj = dt_time(9, 15)
+
     if "-" in shift_hours:
         parts = shift_hours.split("-", 1)
         today_start = parts[0].strip()
         today_end = parts[1].strip()
-        
+
         # Calculate scheduled total hours
         try:
-            from datetime import datetime
-            import re
-            
             # Normalize: ensure there's a space before AM/PM
-            start_str = today_start.upper()
-            end_str = today_end.upper()
-            
-            # Add space before AM/PM if missing (e.g., "10:00AM" -> "10:00 AM")
-            start_str = re.sub(r'(\d)(AM|PM)', r'\1 \2', start_str)
-            end_str = re.sub(r'(\d)(AM|PM)', r'\1 \2', end_str)
-            
+            # (e.g., "10:00AM" -> "10:00 AM")
+            start_str = _AMPM_RE.sub(r'\1 \2', today_start.upper())
+            end_str = _AMPM_RE.sub(r'\1 \2', today_end.upper())
+
+            # Pick the format from the string shape instead of trying both
+            # and eating the ValueError on common inputs like "9 AM"
             start_time = None
             end_time = None
-            
-            # Try parsing with minutes first, then without
-            for fmt in ["%I:%M %p", "%I %p"]:
-                if start_time is None:
-                    try:
-                        start_time = datetime.strptime(start_str, fmt)
-                    except ValueError:
-                        pass
-                if end_time is None:
-                    try:
-                        end_time = datetime.strptime(end_str, fmt)
-                    except ValueError:
-                        pass
-            
+            try:
+                start_time = datetime.strptime(
+                    start_str, "%I:%M %p" if ":" in start_str else "%I %p"
+                )
+                end_time = datetime.strptime(
+                    end_str, "%I:%M %p" if ":" in end_str else "%I %p"
+                )
+            except ValueError:
+                pass
+
             if start_time and end_time:
                 # Handle case where end time is next day (e.g., 11 PM - 6 AM)
                 if end_time < start_time:
                     end_time = end_time.replace(day=end_time.day + 1)
-                
+
                 duration = end_time - start_time
                 total_seconds = duration.total_seconds()
                 hours = int(total_seconds // 3600)
                 minutes = int((total_seconds % 3600) // 60)
                 today_total_hours = f"{hours}h {minutes:02d}m"
-                
+
                 # Calculate late threshold as start time + 15 minutes
                 late_threshold_dt = start_time + timedelta(minutes=15)
                 late_threshold_time = late_threshold_dt.strftime("%I:%M %p").lstrip("0")
-        except Exception as e:
+                threshold_time_obj = late_threshold_dt.time()
+        except (ValueError, TypeError):
             today_total_hours = "8h 00m"
             late_threshold_time = "9:15 AM"
+            threshold_time_obj = dt_time(9, 15)
+
+    return today_start, today_end, today_total_hours, late_threshold_time, threshold_time_obj
+
+
+@cache_page(30)
+@vary_on_cookie
+def employee_schedule_view(request, employee_id):
+    """Employee schedule page with real current dates for the week."""
+    if not can_access_employee(request.user, employee_id, request.session):
+        messages.error(request, "You don't have permission to access this page.")
+        return redirect("login")
+
+    employee = _get_employee_or_404(employee_id, with_related=True)
+    personal = _cached_rel(employee, "employeepersonalinfo")
+    schedule = _cached_rel(employee, "workschedule")
+
+    today = timezone.localdate()
+    now = timezone.localtime()
+
+    # Determine current week (Monday to Sunday)
+    start_of_week = today - timedelta(days=today.weekday())
+    end_of_week = start_of_week + timedelta(days=6)
+
+    week_range_label = f"{start_of_week.strftime('%b %d')} - {end_of_week.strftime('%b %d')}"
+
+    default_shift_hours = "9:00 AM - 5:00 PM"
+    shift_hours = schedule.working_hours if schedule and schedule.working_hours else default_shift_hours
+
+    # Parse shift hours for today's scheduled times (memoized per string)
+    (
+        today_start,
+        today_end,
+        today_total_hours,
+        late_threshold_time,
+        threshold_time_obj,
+    ) = _parse_shift(shift_hours)
+
+    # Working day detection based on schedule working_days text or Mon-Fri default
+    working_mask = _working_mask(schedule.working_days if schedule else None)
 
     week_days = []
     for i in range(7):
         day_date = start_of_week + timedelta(days=i)
         is_today = day_date == today
-        weekday_short = day_date.strftime("%a").upper()
-        date_label = day_date.strftime("%b %d")
-
-        # Working day detection based on schedule working_days text or Mon-Fri default
-        is_working = False
-        if schedule and schedule.working_days:
-            working_days_lower = schedule.working_days.lower()
-            weekday_full = day_date.strftime("%A").lower()
-            
-            # Check for common patterns like "Monday - Friday" or individual day names
-            if "monday" in working_days_lower and "friday" in working_days_lower:
-                # Pattern like "Monday - Friday" means all weekdays
-                is_working = day_date.weekday() < 5
-            elif weekday_full in working_days_lower:
-                # Individual day name found
-                is_working = True
-        else:
-            # Default: Monday through Friday
-            is_working = day_date.weekday() < 5
+        weekday_short = _WEEKDAY_SHORT[day_date.weekday()]
+        date_label = f"{_MONTH_ABBR[day_date.month]} {day_date.day:02d}"
+        is_working = bool(working_mask >> day_date.weekday() & 1)
 
         week_days.append(
             {
@@ -1516,12 +1736,6 @@ def employee_schedule_view(request, employee_id):
     ).first()
 
     # Format attendance times
-    def _format_time(dt):
-        if not dt:
-            return "--:--"
-        local_dt = timezone.localtime(dt)
-        return local_dt.strftime("%I:%M %p").lstrip("0")
-
     check_in_display = _format_time(attendance.check_in) if attendance else "--:--"
     check_out_display = _format_time(attendance.check_out) if attendance else "--:--"
 
@@ -1534,20 +1748,16 @@ def employee_schedule_view(request, employee_id):
         total_hours_display = f"{hours}h {minutes:02d}m"
 
     # Calculate time late
-    from datetime import datetime
     time_late_display = "--"
     time_late_color = "text-gray-500"
     
     if attendance and attendance.check_in:
         try:
-            # Parse the late threshold time
-            threshold_time_obj = datetime.strptime(late_threshold_time, "%I:%M %p")
-            
-            # Create threshold datetime for today
+            # Threshold time object comes pre-parsed from _parse_shift
             threshold_dt = timezone.make_aware(
-                datetime.combine(today, threshold_time_obj.time())
+                datetime.combine(today, threshold_time_obj)
             )
-            
+
             # Calculate difference
             if attendance.check_in > threshold_dt:
                 late_seconds = int((attendance.check_in - threshold_dt).total_seconds())
@@ -1561,7 +1771,7 @@ def employee_schedule_view(request, employee_id):
             else:
                 time_late_display = "On Time"
                 time_late_color = "text-emerald-600"
-        except:
+        except (ValueError, TypeError):
             time_late_display = "--"
             time_late_color = "text-gray-500"
 
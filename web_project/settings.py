@@ -49,6 +49,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.RequestTodayMiddleware',
 ]
 
 ROOT_URLCONF = 'web_project.urls'
@@ -57,13 +58,19 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Parse each template once per process instead of per request
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -78,6 +85,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections alive between requests instead of reopening one
+        # per request; the health check guards against reusing a dead one.
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -113,6 +124,12 @@ USE_I18N = True
 USE_TZ = True
 
 
+# Default primary key field type
+# https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
@@ -126,6 +143,18 @@ STATICFILES_DIRS = [
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Stream uploads (CNIC/contract scans, face images) straight to a temp file
+# instead of buffering them in worker memory; FileSystemStorage moves the
+# temp file into MEDIA_ROOT rather than copying it.
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+# Keep upload temp files on the same filesystem as MEDIA_ROOT so storage
+# can os.rename them into place instead of copying the bytes again
+FILE_UPLOAD_TEMP_DIR = os.path.join(MEDIA_ROOT, 'tmp')
+os.makedirs(FILE_UPLOAD_TEMP_DIR, exist_ok=True)
+
 # Authentication settings
 LOGIN_URL = 'login'
 LOGIN_REDIRECT_URL = 'index'
@@ -137,3 +166,5 @@ FACE_API_BASE_URL = os.getenv('FACE_API_BASE_URL', 'http://13.50.238.213:8000')
 FACE_API_CONNECT_TIMEOUT = float(os.getenv('FACE_API_CONNECT_TIMEOUT', '5'))
 FACE_API_READ_TIMEOUT = float(os.getenv('FACE_API_READ_TIMEOUT', '60'))
 FACE_API_ENABLED = os.getenv('FACE_API_ENABLED', 'true').lower() in {'1', 'true', 'yes'}
+# HTTP connection pool size for the shared face API session
+FACE_API_POOL_SIZE = int(os.getenv('FACE_API_POOL_SIZE', '32'))